@@ -1,116 +1,245 @@
 import os
 import time
 import threading
-import hashlib
+import queue
+from concurrent.futures import ProcessPoolExecutor
 import pickle
 import numpy as np
 import pyaudio
 import tkinter as tk
 from tkinter import scrolledtext, filedialog, ttk
-from scipy.signal import spectrogram
-from scipy.ndimage import maximum_filter
+from scipy.signal import get_window
+from scipy.fft import rfft, rfftfreq
 from scipy.io import wavfile
+from numba import njit
 
 NFFT = 4096
+CHUNK = 4096
 noverlap = 2048
+hop = NFFT - noverlap
 threshold_percentile = 80
 neighborhood_size = (20, 20)
 fan_value = 10
+window = get_window(('tukey', 0.25), NFFT).astype(np.float32)
+
+db_dir = "fingerprint_db"
+db_arrays = ("keys", "index", "song_ids", "offsets")
 
-fingerprint_db = {}
 song_titles = {}
+db_keys = np.empty(0, dtype=np.int64)
+db_index = np.zeros(1, dtype=np.int64)
+db_song_ids = np.empty(0, dtype=np.int32)
+db_offsets = np.empty(0, dtype=np.float32)
+
+visualizer_lock = threading.Lock()
+visualizer_samples = None
+visualizer_pending = False
+visualizer_levels = np.empty(CHUNK, dtype=np.float32)
+
+@njit(cache=True)
+def pick_peaks(Sxx_log, threshold, size_f, size_t):
+    num_f, num_t = Sxx_log.shape
+    before_f = size_f // 2
+    before_t = size_t // 2
+    after_f = size_f - before_f - 1
+    after_t = size_t - before_t - 1
+    peaks = np.empty((1024, 2), dtype=np.int64)
+    count = 0
+    for j in range(num_t):
+        for i in range(num_f):
+            value = Sxx_log[i, j]
+            if not value > threshold:
+                continue
+            is_peak = True
+            for jj in range(max(0, j - before_t), min(num_t, j + after_t + 1)):
+                for ii in range(max(0, i - before_f), min(num_f, i + after_f + 1)):
+                    if Sxx_log[ii, jj] > value:
+                        is_peak = False
+                        break
+                if not is_peak:
+                    break
+            if is_peak:
+                if count == peaks.shape[0]:
+                    grown = np.empty((2 * count, 2), dtype=np.int64)
+                    grown[:count] = peaks
+                    peaks = grown
+                peaks[count, 0] = i
+                peaks[count, 1] = j
+                count += 1
+    return peaks[:count]
+
+def power_spectrum(frames, fs):
+    frames = frames - frames.mean(axis=1, keepdims=True)
+    frames *= window
+    spectrum = rfft(frames, axis=1, workers=-1, overwrite_x=True)
+    Sxx = spectrum.real**2 + spectrum.imag**2
+    Sxx *= np.float32(1 / (fs * np.sum(window**2)))
+    Sxx[:, 1:-1] *= 2
+    return Sxx
 
 def fingerprint(audio, fs):
-    f, t, Sxx = spectrogram(audio, fs, nperseg=NFFT, noverlap=noverlap)
-    Sxx_log = 10 * np.log10(Sxx + 1e-10)
-    threshold = np.percentile(Sxx_log, threshold_percentile)
-    local_max = maximum_filter(Sxx_log, size=neighborhood_size)
-    peaks = (Sxx_log == local_max) & (Sxx_log > threshold)
-    peak_indices = np.argwhere(peaks)
-    if peak_indices.size > 0:
-        peak_indices = peak_indices[np.argsort(peak_indices[:, 1])]
-    else:
+    audio = audio.astype(np.float32, copy=False)
+    if len(audio) < NFFT:
+        return []
+    frames = np.lib.stride_tricks.sliding_window_view(audio, NFFT)[::hop]
+    return fingerprint_spectrum(power_spectrum(frames, fs).T, fs)
+
+def fingerprint_spectrum(Sxx, fs):
+    if Sxx.shape[1] == 0:
         return []
-    peak_freqs = f[peak_indices[:, 0]]
+    f = rfftfreq(NFFT, 1 / fs)
+    t = (np.arange(Sxx.shape[1]) * hop + NFFT / 2) / fs
+    Sxx_log = 10 * np.log10(Sxx + np.float32(1e-10))
+    sample = Sxx_log.ravel(order="K")[::10]
+    k = min(int(sample.size * threshold_percentile / 100), sample.size - 1)
+    threshold = np.partition(sample, k)[k]
+    peak_indices = pick_peaks(Sxx_log, threshold, neighborhood_size[0], neighborhood_size[1])
+    if peak_indices.size == 0:
+        return []
+    peak_freqs = f[peak_indices[:, 0]].astype(np.int64)
     peak_times = t[peak_indices[:, 1]]
-    fingerprints = []
     num_peaks = len(peak_indices)
-    for i in range(num_peaks):
-        for j in range(1, fan_value):
-            if (i + j) < num_peaks:
-                f1 = int(peak_freqs[i])
-                f2 = int(peak_freqs[i + j])
-                t1 = peak_times[i]
-                t2 = peak_times[i + j]
-                dt = int(round(t2 - t1))
-                if 0 <= dt <= 10:
-                    hash_val = hashlib.sha1(f"{f1}|{f2}|{dt}".encode()).hexdigest()
-                    fingerprints.append((hash_val, t1))
-    return fingerprints
+    num_pairs = sum(max(num_peaks - j, 0) for j in range(1, fan_value))
+    keys = np.empty(num_pairs, dtype=np.int64)
+    times = np.empty(num_pairs, dtype=peak_times.dtype)
+    count = 0
+    for j in range(1, fan_value):
+        f1 = peak_freqs[:-j]
+        f2 = peak_freqs[j:]
+        dt = np.rint(peak_times[j:] - peak_times[:-j]).astype(np.int32)
+        valid = (dt >= 0) & (dt <= 10)
+        n = np.count_nonzero(valid)
+        keys[count:count + n] = ((f1[valid] & 0xFFFFF) | ((f2[valid] & 0xFFFFF) << 20)
+                                 | ((dt[valid].astype(np.int64) & 0xFF) << 40))
+        times[count:count + n] = peak_times[:-j][valid]
+        count += n
+    return list(zip(keys[:count].tolist(), times[:count].tolist()))
+
+def split_hashes(hashes):
+    keys = np.fromiter((h for h, _ in hashes), dtype=np.int64, count=len(hashes))
+    times = np.fromiter((t for _, t in hashes), dtype=np.float64, count=len(hashes))
+    return keys, times
+
+def read_wav(filepath):
+    fs, audio = wavfile.read(filepath)
+    if audio.ndim > 1:
+        audio = audio[:, 0]
+    return fs, audio.astype(np.float32)
+
+def fingerprint_file(filepath):
+    fs, audio = read_wav(filepath)
+    return split_hashes(fingerprint(audio, fs))
 
 def create_database(folder="songs"):
-    global fingerprint_db, song_titles
-    fingerprint_db = {}
+    global song_titles
     song_titles = {}
+    keys = [np.empty(0, dtype=np.int64)]
+    song_ids = [np.empty(0, dtype=np.int32)]
+    offsets = [np.empty(0, dtype=np.float32)]
     song_id = 0
     if not os.path.isdir(folder):
         print(f"Folder '{folder}' does not exist. Please create it and add WAV files.")
+        pack_database(keys, song_ids, offsets)
         return
-    for filename in os.listdir(folder):
-        if filename.lower().endswith(".wav"):
-            filepath = os.path.join(folder, filename)
+    filenames = [filename for filename in os.listdir(folder) if filename.lower().endswith(".wav")]
+    with ProcessPoolExecutor() as executor:
+        futures = [executor.submit(fingerprint_file, os.path.join(folder, filename)) for filename in filenames]
+        for filename, future in zip(filenames, futures):
             try:
-                fs, audio = wavfile.read(filepath)
-                if audio.ndim > 1:
-                    audio = audio[:, 0]
-                fps = fingerprint(audio, fs)
-                for h, offset in fps:
-                    fingerprint_db.setdefault(h, []).append((song_id, offset))
+                song_keys, song_offsets = future.result()
+                keys.append(song_keys)
+                song_ids.append(np.full(len(song_keys), song_id, dtype=np.int32))
+                offsets.append(song_offsets.astype(np.float32))
                 song_titles[song_id] = filename
-                print(f"Fingerprinted: {filename} ({len(fps)} hashes)")
+                print(f"Fingerprinted: {filename} ({len(song_keys)} hashes)")
                 song_id += 1
             except Exception as e:
                 print(f"Error processing {filename}: {e}")
-
-def match_fingerprint(query_hashes):
-    matches = {}
-    for h, query_time in query_hashes:
-        if h in fingerprint_db:
-            for song_id, song_time in fingerprint_db[h]:
-                diff = int(round(song_time - query_time))
-                matches.setdefault(song_id, {}).setdefault(diff, 0)
-                matches[song_id][diff] += 1
-    best_song = None
+    pack_database(keys, song_ids, offsets)
+
+def pack_database(keys, song_ids, offsets):
+    global db_keys, db_index, db_song_ids, db_offsets
+    keys = np.concatenate(keys)
+    order = np.argsort(keys, kind="stable")
+    db_keys, first = np.unique(keys[order], return_index=True)
+    db_index = np.append(first, keys.size).astype(np.int64)
+    db_song_ids = np.concatenate(song_ids)[order]
+    db_offsets = np.concatenate(offsets)[order]
+
+@njit(cache=True)
+def match_counts(query_keys, query_times, keys, index, song_ids, offsets, num_songs):
+    rows = np.searchsorted(keys, query_keys)
+    min_diff = 1 << 62
+    max_diff = -(1 << 62)
+    for i in range(query_keys.size):
+        r = rows[i]
+        if r < keys.size and keys[r] == query_keys[i]:
+            for p in range(index[r], index[r + 1]):
+                diff = int(np.rint(offsets[p] - query_times[i]))
+                min_diff = min(min_diff, diff)
+                max_diff = max(max_diff, diff)
+    if max_diff < min_diff:
+        return -1, 0
+    counts = np.zeros((num_songs, max_diff - min_diff + 1), dtype=np.int32)
+    for i in range(query_keys.size):
+        r = rows[i]
+        if r < keys.size and keys[r] == query_keys[i]:
+            for p in range(index[r], index[r + 1]):
+                diff = int(np.rint(offsets[p] - query_times[i]))
+                counts[song_ids[p], diff - min_diff] += 1
+    best_song = -1
     best_count = 0
-    for song_id, offsets in matches.items():
-        count = max(offsets.values())
+    for song_id in range(num_songs):
+        count = counts[song_id].max()
         if count > best_count:
             best_count = count
             best_song = song_id
     return best_song, best_count
 
+def match_fingerprint(query_hashes):
+    query_keys, query_times = split_hashes(query_hashes)
+    best_song, best_count = match_counts(query_keys, query_times, db_keys, db_index,
+                                         db_song_ids, db_offsets, len(song_titles))
+    if best_song < 0:
+        return None, 0
+    return int(best_song), int(best_count)
+
 def record_audio(duration=10, update_callback=None):
-    CHUNK = 4096
     FORMAT = pyaudio.paInt16
     CHANNELS = 1
     RATE = 44100
+    chunks = queue.Queue()
+    def callback(in_data, frame_count, time_info, status):
+        chunks.put(in_data)
+        return None, pyaudio.paContinue
+    num_chunks = int(RATE / CHUNK * duration)
+    audio_np = np.empty(num_chunks * CHUNK, dtype=np.float32)
+    spectra = [np.empty((0, NFFT // 2 + 1), dtype=np.float32)]
+    pos = 0
+    num_frames = 0
     pa = pyaudio.PyAudio()
     stream = pa.open(format=FORMAT, channels=CHANNELS, rate=RATE,
-                     input=True, frames_per_buffer=CHUNK)
-    frames = []
+                     input=True, frames_per_buffer=CHUNK, stream_callback=callback)
     print("Recording audio from mic...")
-    for _ in range(0, int(RATE / CHUNK * duration)):
-        data = stream.read(CHUNK)
-        frames.append(data)
+    for _ in range(num_chunks):
+        data = chunks.get()
+        n = len(data) // 2
+        audio_np[pos:pos + n] = np.frombuffer(data, dtype=np.int16)
+        pos += n
         if update_callback is not None:
             update_callback(data)
+        if pos >= NFFT:
+            ready = (pos - NFFT) // hop + 1
+            if ready > num_frames:
+                segment = audio_np[num_frames * hop:(ready - 1) * hop + NFFT]
+                frames = np.lib.stride_tricks.sliding_window_view(segment, NFFT)[::hop]
+                spectra.append(power_spectrum(frames, RATE))
+                num_frames = ready
     print("Recording finished.")
     stream.stop_stream()
     stream.close()
     pa.terminate()
-    audio_data = b"".join(frames)
-    audio_np = np.frombuffer(audio_data, dtype=np.int16)
-    return RATE, audio_np
+    return RATE, audio_np[:pos], np.concatenate(spectra).T
 
 def evaluate_score(score):
     if score >= 20:
@@ -126,17 +255,18 @@ def update_progress(progress_var, progress_step, status_var, status_text):
     root.update_idletasks()
 
 def save_fingerprint_database():
-    with open("fingerprint_db.pickle", "wb") as f:
-        pickle.dump(fingerprint_db, f)
+    os.makedirs(db_dir, exist_ok=True)
+    for name, array in zip(db_arrays, (db_keys, db_index, db_song_ids, db_offsets)):
+        np.save(os.path.join(db_dir, f"{name}.npy"), array)
     with open("song_titles.pickle", "wb") as f:
         pickle.dump(song_titles, f)
     print("Fingerprint database saved to disk.")
 
 def load_fingerprint_database():
-    global fingerprint_db, song_titles
-    if os.path.exists("fingerprint_db.pickle") and os.path.exists("song_titles.pickle"):
-        with open("fingerprint_db.pickle", "rb") as f:
-            fingerprint_db = pickle.load(f)
+    global song_titles, db_keys, db_index, db_song_ids, db_offsets
+    db_paths = [os.path.join(db_dir, f"{name}.npy") for name in db_arrays]
+    if all(os.path.exists(path) for path in db_paths) and os.path.exists("song_titles.pickle"):
+        db_keys, db_index, db_song_ids, db_offsets = (np.load(path, mmap_mode="r") for path in db_paths)
         with open("song_titles.pickle", "rb") as f:
             song_titles = pickle.load(f)
         print("Loaded fingerprint database from disk.")
@@ -146,28 +276,41 @@ def load_fingerprint_database():
         save_fingerprint_database()
 
 def update_visualizers(chunk_data):
-    samples = np.frombuffer(chunk_data, dtype=np.int16)
+    global visualizer_samples, visualizer_pending
+    with visualizer_lock:
+        visualizer_samples = np.frombuffer(chunk_data, dtype=np.int16)
+        if visualizer_pending:
+            return
+        visualizer_pending = True
+    root.after(0, redraw_visualizers)
+
+def redraw_visualizers():
+    global visualizer_pending
+    with visualizer_lock:
+        samples = visualizer_samples
+        visualizer_pending = False
     def draw_waveform():
         canvas_width = waveform_canvas.winfo_width() or 650
         canvas_height = waveform_canvas.winfo_height() or 150
-        if np.max(np.abs(samples)) != 0:
-            samples_norm = samples / np.max(np.abs(samples))
+        step = max(1, len(samples) // canvas_width)
+        decimated = samples[::step]
+        peak = max(int(samples.max()), -int(samples.min()))
+        if peak != 0:
+            samples_norm = decimated / peak
         else:
-            samples_norm = samples
+            samples_norm = decimated
         samples_y = (canvas_height/2) - (samples_norm * (canvas_height/2))
-        step = max(1, len(samples_y) // canvas_width)
-        points = []
-        for i in range(0, len(samples_y), step):
-            x = (i / len(samples_y)) * canvas_width
-            y = samples_y[i]
-            points.extend([x, y])
+        samples_x = np.arange(0, len(samples), step) * (canvas_width / len(samples))
+        points = np.column_stack((samples_x, samples_y)).ravel().tolist()
         waveform_canvas.delete("all")
         if points:
             waveform_canvas.create_line(points, fill="lime", smooth=True)
-    root.after(0, draw_waveform)
+    draw_waveform()
 
     def update_volume():
-        rms = np.sqrt(np.mean(samples.astype(np.float32)**2))
+        levels = visualizer_levels[:len(samples)]
+        levels[:] = samples
+        rms = np.sqrt(np.dot(levels, levels) / len(levels))
         volume_percent = min(100, (rms / 32767) * 100)
         volume_progress["value"] = volume_percent
         if rms > 0:
@@ -175,7 +318,7 @@ def update_visualizers(chunk_data):
         else:
             db = -100
         volume_label.config(text=f"Volume: {db:.1f} dB")
-    root.after(0, update_volume)
+    update_volume()
 
     def draw_frequency():
         freq_canvas.delete("all")
@@ -190,11 +333,11 @@ def update_visualizers(chunk_data):
         else:
             norm_spec = spectrum / max_val
         step = max(1, len(norm_spec) // canvas_width)
-        for i in range(0, len(norm_spec), step):
-            x = (i / len(norm_spec)) * canvas_width
-            bar_height = norm_spec[i] * canvas_height
-            freq_canvas.create_line(x, canvas_height, x, canvas_height - bar_height, fill="cyan")
-    root.after(0, draw_frequency)
+        bars_x = np.arange(0, len(norm_spec), step) * (canvas_width / len(norm_spec))
+        bars_y = canvas_height - norm_spec[::step] * canvas_height
+        for x, y in zip(bars_x.tolist(), bars_y.tolist()):
+            freq_canvas.create_line(x, canvas_height, x, y, fill="cyan")
+    draw_frequency()
 
 def start_matching_mic():
     result_frame.pack_forget()  # Hide the result frame
@@ -221,9 +364,9 @@ def proceed_with_recording(duration):
     
     def process():
         update_progress(progress_var, 20, status_var, "Recording audio from microphone...")
-        fs, audio = record_audio(duration=duration, update_callback=update_visualizers)
+        fs, audio, Sxx = record_audio(duration=duration, update_callback=update_visualizers)
         update_progress(progress_var, 20, status_var, "Processing fingerprint...")
-        query_hashes = fingerprint(audio, fs)
+        query_hashes = fingerprint_spectrum(Sxx, fs)
         update_progress(progress_var, 30, status_var, f"Extracted {len(query_hashes)} fingerprint hashes. Matching...")
         best_song, score = match_fingerprint(query_hashes)
         update_progress(progress_var, 30, status_var, "Match complete!")
@@ -267,9 +410,7 @@ def start_matching_file():
     def process():
         update_progress(progress_var, 20, status_var, f"Reading file: {os.path.basename(filepath)}")
         try:
-            fs, audio = wavfile.read(filepath)
-            if audio.ndim > 1:
-                audio = audio[:, 0]
+            fs, audio = read_wav(filepath)
         except Exception as e:
             status_var.set(f"Error reading file: {e}")
             progress_var.set(100)
@@ -319,131 +460,132 @@ def refresh_database():
     
     threading.Thread(target=process).start()
 
-load_fingerprint_database()
-print("Fingerprint database ready.")
-
-root = tk.Tk()
-root.title("Pyzam - Music Recognition")
-root.geometry("700x800")
-root.configure(bg="#f5f5f5")
-
-style = ttk.Style()
-style.configure("TFrame", background="#f5f5f5")
-style.configure("TButton", font=("Segoe UI", 12), padding=6)
-style.configure("TLabel", background="#f5f5f5", font=("Segoe UI", 12))
-style.configure("TProgressbar", thickness=10)
-
-header_frame = tk.Frame(root, bg="#3498db", padx=20, pady=15)
-header_frame.pack(fill=tk.X)
-app_logo = tk.Label(header_frame, text="🎵", font=("Segoe UI", 28), bg="#3498db", fg="white")
-app_logo.pack(side=tk.LEFT, padx=(0, 10))
-app_title = tk.Label(header_frame, text="Pyzam", font=("Segoe UI", 28, "bold"), bg="#3498db", fg="white")
-app_title.pack(side=tk.LEFT)
-app_subtitle = tk.Label(header_frame, text="Music Recognition", font=("Segoe UI", 14), bg="#3498db", fg="white")
-app_subtitle.pack(side=tk.LEFT, padx=(10, 0))
-
-main_frame = ttk.Frame(root)
-main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-
-control_frame = ttk.Frame(main_frame)
-control_frame.pack(pady=10)
-
-button_frame = ttk.Frame(control_frame)
-button_frame.pack()
-
-mic_icon = "🎤"
-file_icon = "📂"
-refresh_icon = "🔄"
-
-mic_button = tk.Button(
-    button_frame, 
-    text=f"{mic_icon} Listen with Mic", 
-    command=start_matching_mic,
-    font=("Segoe UI", 12),
-    padx=15, pady=10,
-    bg="#3498db", fg="white",
-    relief=tk.FLAT,
-    width=18
-)
-mic_button.grid(row=0, column=0, padx=10, pady=5)
-
-file_button = tk.Button(
-    button_frame, 
-    text=f"{file_icon} Select File", 
-    command=start_matching_file,
-    font=("Segoe UI", 12),
-    padx=15, pady=10,
-    bg="#2ecc71", fg="white",
-    relief=tk.FLAT,
-    width=18
-)
-file_button.grid(row=0, column=1, padx=10, pady=5)
-
-refresh_button = tk.Button(
-    control_frame, 
-    text=f"{refresh_icon} Refresh Database", 
-    command=refresh_database,
-    font=("Segoe UI", 10),
-    bg="#f5f5f5", fg="#555",
-    relief=tk.FLAT,
-    borderwidth=1
-)
-refresh_button.pack(pady=(10, 0))
-
-duration_frame = ttk.Frame(main_frame, relief=tk.RIDGE, borderwidth=2)
-duration_var = tk.IntVar(value=10)
-ttk.Label(duration_frame, text="Recording Duration (seconds):", font=("Segoe UI", 12)).pack(pady=5)
-ttk.Spinbox(duration_frame, from_=1, to=60, textvariable=duration_var, width=5, font=("Segoe UI", 12)).pack(pady=5)
-ttk.Button(duration_frame, text="Start Recording", command=confirm_duration, style="TButton").pack(pady=10)
-duration_frame.place_forget()
-
-visualizer_frame = ttk.Frame(main_frame)
-
-waveform_canvas = tk.Canvas(visualizer_frame, width=650, height=150, bg="black")
-waveform_canvas.pack(fill=tk.BOTH, expand=True, pady=(0,5))
-
-volume_frame = ttk.Frame(visualizer_frame)
-volume_frame.pack(fill=tk.X, pady=(0,5))
-volume_label = ttk.Label(volume_frame, text="Volume: - dB", font=("Segoe UI", 12))
-volume_label.pack(side=tk.LEFT, padx=(0,5))
-volume_progress = ttk.Progressbar(volume_frame, orient="horizontal", length=500, mode="determinate")
-volume_progress.pack(side=tk.LEFT, padx=(0,5))
-
-freq_canvas = tk.Canvas(visualizer_frame, width=650, height=150, bg="black")
-freq_canvas.pack(fill=tk.BOTH, expand=True)
-
-progress_frame = ttk.Frame(main_frame)
-progress_var = tk.DoubleVar()
-status_var = tk.StringVar()
-status_var.set("Ready")
-status_label = ttk.Label(progress_frame, textvariable=status_var)
-status_label.pack(pady=(0, 5), anchor=tk.W)
-progress = ttk.Progressbar(progress_frame, variable=progress_var, length=650, mode="determinate")
-progress.pack(fill=tk.X, pady=5)
-
-result_frame = ttk.Frame(main_frame)
-result_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
-result_header = ttk.Frame(result_frame)
-result_header.pack(fill=tk.X, pady=(0, 10))
-result_icon_label = tk.Label(result_header, text="🎵", font=("Segoe UI", 48), fg="#3498db", bg="#f5f5f5")
-result_icon_label.pack(side=tk.LEFT, padx=(0, 15))
-result_title_frame = ttk.Frame(result_header)
-result_title_frame.pack(side=tk.LEFT)
-result_title = ttk.Label(result_title_frame, text="Ready to Identify Music", font=("Segoe UI", 16, "bold"))
-result_title.pack(anchor=tk.W)
-result_subtitle = ttk.Label(result_title_frame, text="Click one of the buttons above to start", font=("Segoe UI", 12))
-result_subtitle.pack(anchor=tk.W)
-result_text_frame = ttk.Frame(result_frame)
-result_text_frame.pack(fill=tk.BOTH, expand=True)
-result_text = scrolledtext.ScrolledText(result_text_frame, width=70, height=10, font=("Segoe UI", 12))
-result_text.pack(fill=tk.BOTH, expand=True)
-result_text.insert(tk.END, "Welcome to Pyzam!\n\nTo identify music:\n1. Click 'Listen with Mic' to record from your microphone\n   a. Select recording duration when prompted\n2. Click 'Select File' to compare from a WAV file")
-result_text.config(state=tk.DISABLED)
-
-footer_frame = tk.Frame(root, bg="#f0f0f0", padx=10, pady=5)
-footer_frame.pack(fill=tk.X, side=tk.BOTTOM)
-footer_text = tk.Label(footer_frame, text="Pyzam Music Recognition © 2025", font=("Segoe UI", 8), bg="#f0f0f0", fg="#888")
-footer_text.pack(side=tk.RIGHT)
-
-progress_frame.pack_forget()
-root.mainloop()
+if __name__ == "__main__":
+    load_fingerprint_database()
+    print("Fingerprint database ready.")
+
+    root = tk.Tk()
+    root.title("Pyzam - Music Recognition")
+    root.geometry("700x800")
+    root.configure(bg="#f5f5f5")
+
+    style = ttk.Style()
+    style.configure("TFrame", background="#f5f5f5")
+    style.configure("TButton", font=("Segoe UI", 12), padding=6)
+    style.configure("TLabel", background="#f5f5f5", font=("Segoe UI", 12))
+    style.configure("TProgressbar", thickness=10)
+
+    header_frame = tk.Frame(root, bg="#3498db", padx=20, pady=15)
+    header_frame.pack(fill=tk.X)
+    app_logo = tk.Label(header_frame, text="🎵", font=("Segoe UI", 28), bg="#3498db", fg="white")
+    app_logo.pack(side=tk.LEFT, padx=(0, 10))
+    app_title = tk.Label(header_frame, text="Pyzam", font=("Segoe UI", 28, "bold"), bg="#3498db", fg="white")
+    app_title.pack(side=tk.LEFT)
+    app_subtitle = tk.Label(header_frame, text="Music Recognition", font=("Segoe UI", 14), bg="#3498db", fg="white")
+    app_subtitle.pack(side=tk.LEFT, padx=(10, 0))
+
+    main_frame = ttk.Frame(root)
+    main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+
+    control_frame = ttk.Frame(main_frame)
+    control_frame.pack(pady=10)
+
+    button_frame = ttk.Frame(control_frame)
+    button_frame.pack()
+
+    mic_icon = "🎤"
+    file_icon = "📂"
+    refresh_icon = "🔄"
+
+    mic_button = tk.Button(
+        button_frame, 
+        text=f"{mic_icon} Listen with Mic", 
+        command=start_matching_mic,
+        font=("Segoe UI", 12),
+        padx=15, pady=10,
+        bg="#3498db", fg="white",
+        relief=tk.FLAT,
+        width=18
+    )
+    mic_button.grid(row=0, column=0, padx=10, pady=5)
+
+    file_button = tk.Button(
+        button_frame, 
+        text=f"{file_icon} Select File", 
+        command=start_matching_file,
+        font=("Segoe UI", 12),
+        padx=15, pady=10,
+        bg="#2ecc71", fg="white",
+        relief=tk.FLAT,
+        width=18
+    )
+    file_button.grid(row=0, column=1, padx=10, pady=5)
+
+    refresh_button = tk.Button(
+        control_frame, 
+        text=f"{refresh_icon} Refresh Database", 
+        command=refresh_database,
+        font=("Segoe UI", 10),
+        bg="#f5f5f5", fg="#555",
+        relief=tk.FLAT,
+        borderwidth=1
+    )
+    refresh_button.pack(pady=(10, 0))
+
+    duration_frame = ttk.Frame(main_frame, relief=tk.RIDGE, borderwidth=2)
+    duration_var = tk.IntVar(value=10)
+    ttk.Label(duration_frame, text="Recording Duration (seconds):", font=("Segoe UI", 12)).pack(pady=5)
+    ttk.Spinbox(duration_frame, from_=1, to=60, textvariable=duration_var, width=5, font=("Segoe UI", 12)).pack(pady=5)
+    ttk.Button(duration_frame, text="Start Recording", command=confirm_duration, style="TButton").pack(pady=10)
+    duration_frame.place_forget()
+
+    visualizer_frame = ttk.Frame(main_frame)
+
+    waveform_canvas = tk.Canvas(visualizer_frame, width=650, height=150, bg="black")
+    waveform_canvas.pack(fill=tk.BOTH, expand=True, pady=(0,5))
+
+    volume_frame = ttk.Frame(visualizer_frame)
+    volume_frame.pack(fill=tk.X, pady=(0,5))
+    volume_label = ttk.Label(volume_frame, text="Volume: - dB", font=("Segoe UI", 12))
+    volume_label.pack(side=tk.LEFT, padx=(0,5))
+    volume_progress = ttk.Progressbar(volume_frame, orient="horizontal", length=500, mode="determinate")
+    volume_progress.pack(side=tk.LEFT, padx=(0,5))
+
+    freq_canvas = tk.Canvas(visualizer_frame, width=650, height=150, bg="black")
+    freq_canvas.pack(fill=tk.BOTH, expand=True)
+
+    progress_frame = ttk.Frame(main_frame)
+    progress_var = tk.DoubleVar()
+    status_var = tk.StringVar()
+    status_var.set("Ready")
+    status_label = ttk.Label(progress_frame, textvariable=status_var)
+    status_label.pack(pady=(0, 5), anchor=tk.W)
+    progress = ttk.Progressbar(progress_frame, variable=progress_var, length=650, mode="determinate")
+    progress.pack(fill=tk.X, pady=5)
+
+    result_frame = ttk.Frame(main_frame)
+    result_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+    result_header = ttk.Frame(result_frame)
+    result_header.pack(fill=tk.X, pady=(0, 10))
+    result_icon_label = tk.Label(result_header, text="🎵", font=("Segoe UI", 48), fg="#3498db", bg="#f5f5f5")
+    result_icon_label.pack(side=tk.LEFT, padx=(0, 15))
+    result_title_frame = ttk.Frame(result_header)
+    result_title_frame.pack(side=tk.LEFT)
+    result_title = ttk.Label(result_title_frame, text="Ready to Identify Music", font=("Segoe UI", 16, "bold"))
+    result_title.pack(anchor=tk.W)
+    result_subtitle = ttk.Label(result_title_frame, text="Click one of the buttons above to start", font=("Segoe UI", 12))
+    result_subtitle.pack(anchor=tk.W)
+    result_text_frame = ttk.Frame(result_frame)
+    result_text_frame.pack(fill=tk.BOTH, expand=True)
+    result_text = scrolledtext.ScrolledText(result_text_frame, width=70, height=10, font=("Segoe UI", 12))
+    result_text.pack(fill=tk.BOTH, expand=True)
+    result_text.insert(tk.END, "Welcome to Pyzam!\n\nTo identify music:\n1. Click 'Listen with Mic' to record from your microphone\n   a. Select recording duration when prompted\n2. Click 'Select File' to compare from a WAV file")
+    result_text.config(state=tk.DISABLED)
+
+    footer_frame = tk.Frame(root, bg="#f0f0f0", padx=10, pady=5)
+    footer_frame.pack(fill=tk.X, side=tk.BOTTOM)
+    footer_text = tk.Label(footer_frame, text="Pyzam Music Recognition © 2025", font=("Segoe UI", 8), bg="#f0f0f0", fg="#888")
+    footer_text.pack(side=tk.RIGHT)
+
+    progress_frame.pack_forget()
+    root.mainloop()